@@ -63,8 +63,11 @@ class Dibabel:
 
         print(f'Processing {source} ({qid}) -- {len(targets)} pages')
 
-        for site, title in targets.items():
-            target = ContentPage(site, title)
+        targets = [ContentPage(site, title) for site, title in targets.items()]
+        source.load_history(targets)
+
+        for target in targets:
+            site, title = target.site, target.title
             found, changes, new_content, missing_deps, nonshared_deps = source.find_new_revisions(target)
             if nonshared_deps:
                 print(f'WARNING: {target} has non-shared dependencies: [[{"]], [[".join(nonshared_deps)}]]')
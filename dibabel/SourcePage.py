@@ -1,7 +1,7 @@
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Tuple, List, Dict, Set, Union
+from typing import Tuple, List, Dict, Set, Union, Iterable
 from pywikiapi import Site
 
 from .SiteCache import DiSite
@@ -26,6 +26,7 @@ class RevComment:
     ts: datetime
     comment: str
     content: str
+    revid: int
 
 
 class SourcePage(ContentPage):
@@ -36,15 +37,55 @@ class SourcePage(ContentPage):
 
         self.history = []
         self.is_module = self.title.startswith('Module:')
-        self.generator = self.site.query(
+        self.generator = self._query_history(rvlimit=1)
+
+    def _query_history(self, **kwargs):
+        return self.site.query(
             prop='revisions',
-            rvprop=['user', 'comment', 'timestamp', 'content'],
-            rvlimit=1,
+            rvprop=['ids', 'user', 'comment', 'timestamp', 'content'],
             rvslots='main',
-            titles=self.title)
+            titles=self.title,
+            **kwargs)
+
+    def _add_revisions(self, result) -> bool:
+        """Append revisions from a query result to the history, skipping the ones already there.
+        :return: False if the result had no revisions
+        """
+        if not result or not result.pages or 'revisions' not in result.pages[0]:
+            return False
+        known = {v.revid for v in self.history}
+        result = [RevComment(v.user, datetime.fromisoformat(v.timestamp.rstrip('Z')), v.comment.strip(),
+                             v.slots.main.content, v.revid)
+                  for v in result.pages[0].revisions if v.revid not in known]
+        self.history.extend(sorted(result, key=lambda v: v.ts, reverse=True))
+        return True
+
+    def load_history(self, targets: Iterable[ContentPage]):
+        """Download all revisions made since the oldest target was last edited, plus the revision that was
+        current at that time. Any target copied from the master should match one of them,
+        so find_new_revisions() would not need any more requests regardless of how stale the targets are.
+        :param targets: all target pages of this master page
+        """
+        timestamps = [v for v in (t.get_content_ts() for t in targets) if v]
+        if not timestamps:
+            return
+        oldest = min(timestamps).isoformat() + 'Z'
+        self.history = []
+        # Continuation is handled by the query generator, rvlimit=max uses the fewest requests
+        for result in self._query_history(rvlimit='max', rvend=oldest):
+            self._add_revisions(result)
+        # Fetch the last revision made before the oldest target edit. Older revisions are only needed
+        # for targets with unrecognized content, and get_history() will fetch them on demand.
+        self.generator = self._query_history(rvlimit=1, rvstart=oldest)
+        try:
+            if not self._add_revisions(next(self.generator)):
+                self.generator = None
+        except StopIteration:
+            self.generator = None
 
     def get_history(self):
         """Get history, progressively increasing the number of pages retrieved in each call (e.g. 1, 5, 25, 25, 25...)
+        If load_history() was called, only the revisions older than the ones it fetched are retrieved here.
         """
         yield from self.history
         while self.generator:
@@ -52,14 +93,8 @@ class SourcePage(ContentPage):
                 ind = len(self.history)
                 result = self.generator.send({'rvlimit': min(ind * 5, 25)} if ind > 0 else None)
 
-                if not result or not result.pages:
+                if not self._add_revisions(result):
                     self.generator = None
-                else:
-                    result = [RevComment(v.user, datetime.fromisoformat(v.timestamp.rstrip('Z')), v.comment.strip(),
-                                         v.slots.main.content)
-                              for v in result.pages[0].revisions]
-                    for v in sorted(result, key=lambda v: v.ts, reverse=True):
-                        self.history.append(v)
 
                 for i in range(ind, len(self.history)):
                     yield self.history[i]